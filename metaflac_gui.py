@@ -7,13 +7,17 @@ A Tkinter-based GUI for editing FLAC metadata using the metaflac command-line to
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import tkinter.font as tk_font
+import asyncio
 import subprocess
+import shutil
+import threading
 import os
 import sys
-import argparse
-import re
-from pathlib import Path
-from datetime import datetime
+
+try:
+    from mutagen.flac import FLAC
+except ImportError:
+    FLAC = None  # fall back to the metaflac command-line tool
 
 class MetaFLACGUI:
     def __init__(self, root, scale_factor=1.0, initial_file=None):
@@ -42,6 +46,22 @@ class MetaFLACGUI:
         
         # Current file path
         self.current_file = initial_file
+
+        # metaflac availability - probed lazily, at most once per session
+        self._metaflac_ok = None
+
+        # Tag lines as loaded from the file - lets saves skip unchanged writes
+        self._loaded_lines = None
+
+        # Whether the file held any tags when loaded - assume yes until known,
+        # so the fallback save only skips the removal pass when it is safe
+        self._had_tags = True
+
+        # Background event loop so tag writes never block the Tk main loop;
+        # the lock keeps overlapping saves from rewriting the file at once
+        self._loop = asyncio.new_event_loop()
+        self._write_lock = asyncio.Lock()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
         
         # Common FLAC tags - reordered with BPM, GENRE, TITLE, ARTIST, ALBUM at top
         self.common_tags = [
@@ -52,16 +72,34 @@ class MetaFLACGUI:
         ]
         
         self.setup_ui()
-        
-        # Load initial file if provided
+
         if self.current_file:
             self.file_var.set(self.current_file)
-            self.load_tags()
-        
+
+    @property
+    def current_file(self):
+        return self._current_file
+
+    @current_file.setter
+    def current_file(self, value):
+        # Cache the basename alongside the path - status messages use it
+        # on every update
+        self._current_file = value
+        self._current_basename = os.path.basename(value) if value else ''
+
     def setup_ui(self):
+        # Precompute all scale-derived constants once
+        sf = self.scale_factor
+        pad10 = int(10 * sf)
+        pad5 = int(5 * sf)
+        pad2 = int(2 * sf)
+        text_font_size = int(10 * sf)
+        entry_width = int(40 * sf) if sf < 1.5 else 40
+        text_height = int(6 * sf) if sf > 1.2 else 6
+        custom_width = int(self.root.winfo_screenwidth() * 0.3)  # 30% for custom tags
+
         # Main frame with scaled padding
-        padding = int(10 * self.scale_factor)
-        main_frame = ttk.Frame(self.root, padding=str(padding))
+        main_frame = ttk.Frame(self.root, padding=str(pad10))
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Configure grid weights
@@ -69,20 +107,20 @@ class MetaFLACGUI:
         self.root.rowconfigure(0, weight=1)
         
         # File selection section
-        file_frame = ttk.LabelFrame(main_frame, text="File Selection", padding=str(int(5 * self.scale_factor)))
-        file_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, padding))
+        file_frame = ttk.LabelFrame(main_frame, text="File Selection", padding=str(pad5))
+        file_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, pad10))
         file_frame.columnconfigure(1, weight=1)
         
-        ttk.Button(file_frame, text="Browse", command=self.browse_file).grid(row=0, column=0, padx=(0, int(5 * self.scale_factor)))
+        ttk.Button(file_frame, text="Browse", command=self.browse_file).grid(row=0, column=0, padx=(0, pad5))
         self.file_var = tk.StringVar()
         self.file_entry = ttk.Entry(file_frame, textvariable=self.file_var, state="readonly")
         self.file_entry.grid(row=0, column=1, sticky=(tk.W, tk.E))
         
         # Buttons frame for Load and Save
         buttons_frame = ttk.Frame(file_frame)
-        buttons_frame.grid(row=0, column=2, padx=(int(5 * self.scale_factor), 0))
+        buttons_frame.grid(row=0, column=2, padx=(pad5, 0))
         
-        ttk.Button(buttons_frame, text="Load Tags", command=self.load_tags).pack(pady=(0, int(2 * self.scale_factor)))
+        ttk.Button(buttons_frame, text="Load Tags", command=self.load_tags).pack(pady=(0, pad2))
         ttk.Button(buttons_frame, text="Save Tags", command=self.save_tags).pack()
         
         # Success message label (initially hidden)
@@ -91,105 +129,67 @@ class MetaFLACGUI:
         self.success_label.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # Custom tag section - left side (1/3 width)
-        custom_frame = ttk.LabelFrame(main_frame, text="Custom Tags", padding=str(int(5 * self.scale_factor)))
-        custom_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, padding), padx=(0, int(5 * self.scale_factor)))
+        custom_frame = ttk.LabelFrame(main_frame, text="Custom Tags", padding=str(pad5))
+        custom_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, pad10), padx=(0, pad5))
         custom_frame.columnconfigure(0, weight=1)
         custom_frame.rowconfigure(0, weight=1)
         
-        text_height = int(6 * self.scale_factor) if self.scale_factor > 1.2 else 6
         self.custom_tags_text = scrolledtext.ScrolledText(custom_frame, height=text_height, wrap=tk.WORD)
         
         # Set font size for custom tags text area
-        if self.scale_factor != 1.0:
-            text_font_size = int(10 * self.scale_factor)
+        if sf != 1.0:
             self.custom_tags_text.configure(font=('TkDefaultFont', text_font_size))
         
         self.custom_tags_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Save Tags and Exit button - centered above Metadata Tags section
         save_exit_frame = ttk.Frame(main_frame)
-        save_exit_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, int(5 * self.scale_factor)), padx=(int(5 * self.scale_factor), 0))
+        save_exit_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(0, pad5), padx=(pad5, 0))
         save_exit_frame.columnconfigure(0, weight=1)  # Center the button
         
         ttk.Button(save_exit_frame, text="Save Tags and Exit", command=self.save_tags_and_exit).grid(row=0, column=0)
         
         # Tags editing section - right side (2/3 width)
-        tags_frame = ttk.LabelFrame(main_frame, text="Metadata Tags", padding=str(int(5 * self.scale_factor)))
-        tags_frame.grid(row=2, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, padding), padx=(int(5 * self.scale_factor), 0))
+        tags_frame = ttk.LabelFrame(main_frame, text="Metadata Tags", padding=str(pad5))
+        tags_frame.grid(row=2, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, pad10), padx=(pad5, 0))
         tags_frame.columnconfigure(1, weight=1)
         
         # Set column weights and sizes: Custom tags = 1/3, Metadata tags = 2/3
         main_frame.rowconfigure(1, weight=0)  # Save Tags and Exit button row
         main_frame.rowconfigure(2, weight=1)  # Main content row
         
-        # Calculate screen width for proper proportions
-        screen_width = self.root.winfo_screenwidth()
-        custom_width = int(screen_width * 0.3)  # 30% for custom tags
-        
         main_frame.columnconfigure(0, weight=0, minsize=custom_width)  # Custom tags column (fixed at ~1/3)
         main_frame.columnconfigure(1, weight=1)  # Metadata tags column (takes remaining space)
         
-        # Create scrollable frame for tags
-        canvas_height = int(300 * self.scale_factor)
-        canvas = tk.Canvas(tags_frame, height=canvas_height)
-        scrollbar = ttk.Scrollbar(tags_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Single Text widget with one TAG=value line per common tag -
+        # replaces the 57-widget label/entry/button grid. The Text scrolls
+        # natively, so no Canvas + inner-frame scaffold is needed.
+        self.tags_text = tk.Text(tags_frame, width=entry_width,
+                                 height=len(self.common_tags), wrap=tk.NONE, undo=False)
+        if sf != 1.0:
+            self.tags_text.configure(font=('TkDefaultFont', text_font_size))
+        scrollbar = ttk.Scrollbar(tags_frame, orient="vertical", command=self.tags_text.yview)
+        self.tags_text.configure(yscrollcommand=scrollbar.set)
+
+        self.tags_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         tags_frame.rowconfigure(0, weight=1)
         tags_frame.columnconfigure(0, weight=1)
-        
-        # Store tag entry widgets
-        self.tag_entries = {}
-        
-        # Create entry widgets for common tags with clear buttons
-        entry_width = int(40 * self.scale_factor) if self.scale_factor < 1.5 else 40
-        
-        # Configure columns for proper layout
-        scrollable_frame.columnconfigure(0, weight=0, minsize=120)  # Label column - fixed width
-        scrollable_frame.columnconfigure(1, weight=1)  # Entry column - expandable
-        scrollable_frame.columnconfigure(2, weight=0, minsize=80)  # Button column - fixed width
-        
-        for i, tag in enumerate(self.common_tags):
-            row_padding = int(3 * self.scale_factor)
-            col_padding = int(5 * self.scale_factor)
-            
-            # Tag label
-            label = ttk.Label(scrollable_frame, text=f"{tag}:")
-            label.grid(row=i, column=0, sticky=tk.W, padx=(0, col_padding), pady=row_padding)
-            
-            # Entry widget
-            entry = ttk.Entry(scrollable_frame, width=entry_width)
-            entry.grid(row=i, column=1, sticky=(tk.W, tk.E), pady=row_padding, padx=(0, col_padding))
-            self.tag_entries[tag] = entry
-            
-            # Clear button - using a closure function to properly capture the entry
-            def make_clear_command(current_entry):
-                return lambda: self.clear_entry(current_entry)
-            
-            clear_btn = ttk.Button(scrollable_frame, text="delete", 
-                                 command=make_clear_command(entry))
-            clear_btn.grid(row=i, column=2, pady=row_padding, sticky=tk.W)
-        
+
+        # Fill the template (and load the initial file) after the first
+        # paint so the window shows before any tag work happens. A timer
+        # event is used rather than after_idle because update_idletasks
+        # below would run an idle callback synchronously.
+        self.root.after(0, self._populate_tag_rows)
+
         # Buttons section - centered Save Tags button
         buttons_frame = ttk.Frame(main_frame)
-        buttons_frame.grid(row=3, column=0, columnspan=2, pady=(0, padding))
+        buttons_frame.grid(row=3, column=0, columnspan=2, pady=(0, pad10))
         buttons_frame.columnconfigure(0, weight=1)  # Allow centering
         
-        button_padx = int(5 * self.scale_factor)
-        
         # Center the Save Tags button
         center_frame = ttk.Frame(buttons_frame)
-        center_frame.grid(row=0, column=0, pady=(0, int(10 * self.scale_factor)))
+        center_frame.grid(row=0, column=0, pady=(0, pad10))
         
         ttk.Button(center_frame, text="Save Tags", command=self.save_tags).pack()
         
@@ -197,38 +197,88 @@ class MetaFLACGUI:
         other_buttons_frame = ttk.Frame(buttons_frame)
         other_buttons_frame.grid(row=1, column=0)
         
-        ttk.Button(other_buttons_frame, text="Remove All Tags", command=self.remove_all_tags).pack(side=tk.LEFT, padx=button_padx)
-        ttk.Button(other_buttons_frame, text="Show Raw Output", command=self.show_raw_output).pack(side=tk.LEFT, padx=button_padx)
-        ttk.Button(other_buttons_frame, text="Clear Form", command=self.clear_form).pack(side=tk.LEFT, padx=button_padx)
+        ttk.Button(other_buttons_frame, text="Remove All Tags", command=self.remove_all_tags).pack(side=tk.LEFT, padx=pad5)
+        ttk.Button(other_buttons_frame, text="Show Raw Output", command=self.show_raw_output).pack(side=tk.LEFT, padx=pad5)
+        ttk.Button(other_buttons_frame, text="Clear Form", command=self.clear_form).pack(side=tk.LEFT, padx=pad5)
         
         # Status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready - Select a FLAC file to begin")
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
-        status_bar.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(padding, 0))
+        status_bar.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(pad10, 0))
         
-        # Bind mouse wheel to canvas
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind("<MouseWheel>", _on_mousewheel)
-    
-    def clear_entry(self, entry_widget):
-        """Clear a specific entry widget"""
-        entry_widget.delete(0, tk.END)
+        # Flush all pending geometry work in a single pass
+        self.root.update_idletasks()
+
+    def _populate_tag_rows(self):
+        """Fill the tag template lines, then load the initial file if any"""
+        self.tags_text.insert(1.0, '\n'.join(f"{tag}=" for tag in self.common_tags))
+        if self.current_file:
+            self.load_tags()
+
+    async def _write_tags(self, lines):
+        """Replace all tags on the current file with the given KEY=VALUE lines"""
+        # The subprocess path yields at communicate(), so without the lock a
+        # second save could start a concurrent rewrite of the same file
+        async with self._write_lock:
+            if FLAC is not None:
+                flac = FLAC(self.current_file)
+                if flac.tags is None:
+                    flac.add_tags()
+                flac.tags.clear()
+                for line in lines:
+                    key, value = line.split('=', 1)
+                    flac.tags.append((key, value))
+                flac.save()
+            else:
+                # A file with no tags has nothing to remove - skip the extra
+                # full-file rewrite that --remove-all-tags costs
+                if self._had_tags:
+                    cmd = ['metaflac', '--remove-all-tags', '--import-tags-from=-', self.current_file]
+                else:
+                    cmd = ['metaflac', '--import-tags-from=-', self.current_file]
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await proc.communicate('\n'.join(lines).encode())
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, 'metaflac', stdout, stderr)
+
+    def _save_async(self, lines, on_success):
+        """Run a tag write on the background loop, then post the result back to Tk"""
+        # Nothing changed since load - skip the FLAC rewrite entirely
+        if lines == self._loaded_lines:
+            on_success()
+            return
+
+        async def save():
+            try:
+                await self._write_tags(lines)
+            except Exception as e:
+                # Format eagerly - the except variable is gone by the time
+                # Tk runs the callback
+                msg = f"Failed to save tags: {e}"
+                self.root.after(0, lambda: messagebox.showerror("Error", msg))
+            else:
+                self._loaded_lines = lines
+                self._had_tags = bool(lines)
+                self.root.after(0, on_success)
+        asyncio.run_coroutine_threadsafe(save(), self._loop)
     
     def check_metaflac(self):
-        """Check if metaflac is available"""
-        try:
-            subprocess.run(['metaflac', '--version'], 
-                         capture_output=True, check=True, text=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            messagebox.showerror("Error", 
+        """Check if metaflac is available (probed once, then cached)"""
+        if self._metaflac_ok is None:
+            self._metaflac_ok = shutil.which('metaflac') is not None
+        if not self._metaflac_ok:
+            messagebox.showerror("Error",
                                "metaflac command not found. Please install flac package.\n"
                                "On Ubuntu/Debian: sudo apt install flac\n"
                                "On Fedora/RHEL: sudo dnf install flac\n"
                                "On Arch: sudo pacman -S flac")
-            return False
+        return self._metaflac_ok
     
     def browse_file(self):
         """Browse for FLAC file"""
@@ -239,7 +289,9 @@ class MetaFLACGUI:
         if filename:
             self.current_file = filename
             self.file_var.set(filename)
-            self.status_var.set(f"Selected: {os.path.basename(filename)}")
+            self._loaded_lines = None
+            self._had_tags = True
+            self.status_var.set(f"Selected: {self._current_basename}")
             # Clear success message when new file is selected
             self.success_var.set("")
     
@@ -249,38 +301,55 @@ class MetaFLACGUI:
             messagebox.showwarning("Warning", "Please select a FLAC file first")
             return
         
-        if not self.check_metaflac():
+        if FLAC is None and not self.check_metaflac():
             return
-        
+
         try:
             # Clear existing entries
             self.clear_form()
-            
+
             # Get all tags from the file
-            result = subprocess.run(
-                ['metaflac', '--export-tags-to=-', self.current_file],
-                capture_output=True, text=True, check=True
-            )
-            
-            # Parse the output
+            if FLAC is not None:
+                tag_pairs = list(FLAC(self.current_file).tags or [])
+            else:
+                result = subprocess.run(
+                    ['metaflac', '--export-tags-to=-', self.current_file],
+                    capture_output=True, text=True, check=True
+                )
+                tag_pairs = []
+                for line in result.stdout.splitlines():
+                    key, sep, value = line.partition('=')
+                    if sep:
+                        tag_pairs.append((key, value))
+
+            # Distribute tags between the common area and the custom area -
+            # uppercase only for the match so custom keys keep their case
+            common = dict.fromkeys(self.common_tags, '')
             custom_tags = []
-            for line in result.stdout.strip().split('\n'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.upper()
-                    
-                    if key in self.tag_entries:
-                        self.tag_entries[key].delete(0, tk.END)
-                        self.tag_entries[key].insert(0, value)
-                    else:
-                        custom_tags.append(line)
+            for key, value in tag_pairs:
+                upper_key = key.upper()
+
+                if upper_key in common:
+                    common[upper_key] = value
+                else:
+                    custom_tags.append(f"{key}={value}")
+
+            self.tags_text.delete(1.0, tk.END)
+            self.tags_text.insert(1.0, '\n'.join(f"{tag}={value}"
+                                                 for tag, value in common.items()))
+
+            # Snapshot the loaded state in save order so an unchanged form
+            # can be detected at save time
+            self._loaded_lines = ([f"{tag}={value}" for tag, value in common.items()
+                                   if value.strip()] + custom_tags)
+            self._had_tags = bool(tag_pairs)
             
             # Add custom tags to text area
             if custom_tags:
                 self.custom_tags_text.delete(1.0, tk.END)
                 self.custom_tags_text.insert(1.0, '\n'.join(custom_tags))
             
-            self.status_var.set(f"Loaded tags from {os.path.basename(self.current_file)}")
+            self.status_var.set(f"Loaded tags from {self._current_basename}")
             # Clear success message when loading new tags
             self.success_var.set("")
             
@@ -289,96 +358,51 @@ class MetaFLACGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
     
-    def save_tags_and_exit(self):
-        """Save tags to FLAC file and exit the application"""
+    def _do_save(self, on_success):
+        """Collect the form's tag lines and save them, running on_success after"""
         if not self.current_file:
             messagebox.showwarning("Warning", "Please select a FLAC file first")
             return
-        
-        if not self.check_metaflac():
+
+        if FLAC is None and not self.check_metaflac():
             return
-        
+
         try:
-            # First, remove all existing tags
-            subprocess.run(
-                ['metaflac', '--remove-all-tags', self.current_file],
-                check=True
-            )
-            
-            # Add common tags
-            for tag, entry in self.tag_entries.items():
-                value = entry.get().strip()
-                if value:
-                    subprocess.run(
-                        ['metaflac', f'--set-tag={tag}={value}', self.current_file],
-                        check=True
-                    )
-            
-            # Add custom tags
-            custom_text = self.custom_tags_text.get(1.0, tk.END).strip()
-            if custom_text:
-                for line in custom_text.split('\n'):
-                    line = line.strip()
-                    if line and '=' in line:
-                        subprocess.run(
-                            ['metaflac', f'--set-tag={line}', self.current_file],
-                            check=True
-                        )
-            
-            # Exit silently after successful save
-            self.root.quit()
-            
-        except subprocess.CalledProcessError as e:
-            messagebox.showerror("Error", f"Failed to save tags: {e}")
+            # Collect common tags - lines with empty values are the template
+            lines = []
+            for line in self.tags_text.get(1.0, tk.END).splitlines():
+                key, sep, value = line.strip().partition('=')
+                if sep and key and value.strip():
+                    lines.append(f"{key}={value.strip()}")
+
+            # Collect custom tags
+            for line in self.custom_tags_text.get(1.0, tk.END).splitlines():
+                line = line.strip()
+                key, sep, _ = line.partition('=')
+                if sep and key:
+                    lines.append(line)
+
+            # Write everything off the UI thread
+            self._save_async(lines, on_success)
+
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error: {str(e)}")
-    
+
+    def save_tags_and_exit(self):
+        """Save tags to FLAC file and exit the application"""
+        self._do_save(self.root.quit)
+
     def save_tags(self):
         """Save tags to FLAC file"""
-        if not self.current_file:
-            messagebox.showwarning("Warning", "Please select a FLAC file first")
-            return
-        
-        if not self.check_metaflac():
-            return
-        
-        try:
-            # First, remove all existing tags
-            subprocess.run(
-                ['metaflac', '--remove-all-tags', self.current_file],
-                check=True
-            )
-            
-            # Add common tags
-            for tag, entry in self.tag_entries.items():
-                value = entry.get().strip()
-                if value:
-                    subprocess.run(
-                        ['metaflac', f'--set-tag={tag}={value}', self.current_file],
-                        check=True
-                    )
-            
-            # Add custom tags
-            custom_text = self.custom_tags_text.get(1.0, tk.END).strip()
-            if custom_text:
-                for line in custom_text.split('\n'):
-                    line = line.strip()
-                    if line and '=' in line:
-                        subprocess.run(
-                            ['metaflac', f'--set-tag={line}', self.current_file],
-                            check=True
-                        )
-            
-            # Update status and show success message with datetime
+        def on_success():
+            from datetime import datetime
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.status_var.set(f"Tags saved to {os.path.basename(self.current_file)}")
+            self.status_var.set(f"Tags saved to {self._current_basename}")
             self.success_var.set(f"{current_time} - Tags saved successfully!")
-            
-        except subprocess.CalledProcessError as e:
-            messagebox.showerror("Error", f"Failed to save tags: {e}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
-    
+
+        self._do_save(on_success)
+
+
     def remove_all_tags(self):
         """Remove all tags from FLAC file"""
         if not self.current_file:
@@ -388,20 +412,28 @@ class MetaFLACGUI:
         if not messagebox.askyesno("Confirm", "Remove all tags from this file?"):
             return
         
-        if not self.check_metaflac():
+        if FLAC is None and not self.check_metaflac():
             return
-        
+
         try:
-            subprocess.run(
-                ['metaflac', '--remove-all-tags', self.current_file],
-                check=True
-            )
+            if FLAC is not None:
+                flac = FLAC(self.current_file)
+                flac.delete()
+            else:
+                subprocess.run(
+                    ['metaflac', '--remove-all-tags', self.current_file],
+                    check=True
+                )
             self.clear_form()
-            self.status_var.set(f"All tags removed from {os.path.basename(self.current_file)}")
+            self._loaded_lines = []
+            self._had_tags = False
+            self.status_var.set(f"All tags removed from {self._current_basename}")
             messagebox.showinfo("Success", "All tags removed successfully!")
-            
+
         except subprocess.CalledProcessError as e:
             messagebox.showerror("Error", f"Failed to remove tags: {e}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
     
     def show_raw_output(self):
         """Show raw metaflac output in a new window"""
@@ -409,39 +441,51 @@ class MetaFLACGUI:
             messagebox.showwarning("Warning", "Please select a FLAC file first")
             return
         
-        if not self.check_metaflac():
+        if FLAC is None and not self.check_metaflac():
             return
-        
+
         try:
-            # Get raw output
-            result = subprocess.run(
-                ['metaflac', '--list', '--block-type=VORBIS_COMMENT', self.current_file],
-                capture_output=True, text=True, check=True
-            )
-            
+            # Read just the VORBIS_COMMENT block rather than listing every
+            # block in the file
+            if FLAC is not None:
+                tags = FLAC(self.current_file).tags
+                output = tags.pprint() if tags else ''
+            else:
+                result = subprocess.run(
+                    ['metaflac', '--list', '--block-type=VORBIS_COMMENT',
+                     '--no-utf8-convert', self.current_file],
+                    capture_output=True, text=True, check=True
+                )
+                output = result.stdout
+
             # Create new window
             raw_window = tk.Toplevel(self.root)
-            raw_window.title(f"Raw MetaFLAC Output - {os.path.basename(self.current_file)}")
+            raw_window.title(f"Raw MetaFLAC Output - {self._current_basename}")
             raw_window.geometry("600x400")
-            
-            text_area = scrolledtext.ScrolledText(raw_window, wrap=tk.WORD)
+
+            # undo=False skips the undo-stack allocation for large output
+            text_area = scrolledtext.ScrolledText(raw_window, wrap=tk.WORD, undo=False)
             text_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            text_area.insert(1.0, result.stdout)
+            text_area.insert(1.0, output)
             text_area.config(state=tk.DISABLED)
-            
+
         except subprocess.CalledProcessError as e:
             messagebox.showerror("Error", f"Failed to get raw output: {e}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Unexpected error: {str(e)}")
     
     def clear_form(self):
         """Clear all form fields"""
-        for entry in self.tag_entries.values():
-            entry.delete(0, tk.END)
+        self.tags_text.delete(1.0, tk.END)
+        self.tags_text.insert(1.0, '\n'.join(f"{tag}=" for tag in self.common_tags))
         self.custom_tags_text.delete(1.0, tk.END)
         # Clear success message when form is cleared
         self.success_var.set("")
 
 def main():
-    # Parse command line arguments
+    # Parse command line arguments - argparse is only needed here
+    import argparse
+
     parser = argparse.ArgumentParser(description='MetaFLAC GUI - FLAC Metadata Editor')
     parser.add_argument('file', nargs='?', help='FLAC file to load initially')
     parser.add_argument('--scale', type=float, default=1.0, 